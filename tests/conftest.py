@@ -29,6 +29,18 @@ def env_setup():
     os.environ["LINKEDIN_CLIENT_SECRET"] = "test_secret"
     os.environ["FACEBOOK_ACCESS_TOKEN"] = "test_token"
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the on-disk lookup cache at a per-test temporary directory."""
+    import utils
+    monkeypatch.setattr(utils, "CACHE_DIR", tmp_path / "cache")
+    utils._extract_topics_cached.cache_clear()
+    utils._CONTACT_PAGES.clear()
+    utils._CONTACT_PAGE_LOCKS.clear()
+    utils._JOURNALIST_EMAILS.clear()
+    utils._HOST_LIMITERS.clear()
+    utils._HOST_SLOTS.clear()
+
 @pytest.fixture
 def mock_s3_bucket():
     """Create a mock S3 bucket for testing."""
@@ -2,15 +2,51 @@
 Tests for utility functions.
 """
 import pytest
+import orjson
 from unittest.mock import patch, MagicMock
 from utils import (
     extract_email_from_text,
+    extract_email_from_bytes,
     find_contact_page,
     search_recipients,
+    search_recipients_fallback,
+    search_journalist_email,
     send_email,
-    post_to_social_media
+    post_to_social_media,
+    extract_topics,
+    extract_topics_async,
+    _cache_get,
+    _cache_set,
+    _rank_recipients,
+    _fetch_news_articles,
+    _extract_role,
+    _host_slot,
+    _search_journalist_emails,
+    _JOURNALIST_EMAILS,
+    FALLBACK_QUERY_TEMPLATES,
+    SEARCH_API_URL,
+    MEDIA_DIRECTORIES,
+    SMTP_MAX_RECIPIENTS,
+    _get_page,
+    _parse_html,
+    MAX_PAGE_BYTES,
+    _split_tweets,
+    _create_tweet,
+    _TokenBucket
 )
+import io
+import re
 import os
+import requests
+import time
+import tweepy
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.response import HTTPResponse
+
+def html_response(html: str, charset: str = 'utf-8') -> MagicMock:
+    """Build a mocked HTTP response carrying an HTML body in the given charset."""
+    return MagicMock(status_code=200, text=html, content=html.encode(charset), encoding=charset,
+                     headers={'Content-Type': f'text/html; charset={charset}'})
 
 def test_extract_email_from_text():
     """Test email extraction from text."""
@@ -30,123 +66,247 @@ def test_extract_email_from_text_no_emails():
     emails = extract_email_from_text(text)
     assert len(emails) == 0
 
-@patch('requests.get')
+def test_extract_email_from_text_pathological_input():
+    """Test email extraction on long runs that used to cause heavy backtracking."""
+    text = "-" * 20000 + "@" + "a." * 5000 + " contact: press@example.co.uk"
+    emails = extract_email_from_text(text)
+    assert emails == ["press@example.co.uk"]
+    
+    # An over-long local part is rejected rather than matched from somewhere in the middle
+    assert extract_email_from_text("a" * 200000 + "@example.com") == []
+    assert extract_email_from_text("Scrivi a mario.rossi@example.com.") == ["mario.rossi@example.com"]
+
+def test_extract_email_from_bytes():
+    """Test email extraction from a raw, undecoded page body."""
+    content = "<p>Redazione: redazione@giornale.it, Niccolò niccolo@giornale.it, redazione@giornale.it</p>".encode('utf-8')
+    emails = extract_email_from_bytes(content)
+    assert emails == ["redazione@giornale.it", "niccolo@giornale.it"]
+
+@patch('utils.SESSION.get')
 def test_find_contact_page(mock_get):
     """Test finding contact page URL."""
     # Mock HTML response
-    mock_response = MagicMock()
-    mock_response.text = """
+    mock_response = html_response("""
     <html>
         <body>
             <a href="/contact">Contact Us</a>
             <a href="/about">About</a>
         </body>
     </html>
-    """
+    """)
     mock_get.return_value = mock_response
     
     url = find_contact_page("https://example.com")
     assert url == "https://example.com/contact"
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_find_contact_page_no_contact_link(mock_get):
     """Test finding contact page when no contact link exists."""
     # Mock HTML response
-    mock_response = MagicMock()
-    mock_response.text = """
+    mock_response = html_response("""
     <html>
         <body>
             <a href="/home">Home</a>
         </body>
     </html>
-    """
+    """)
     mock_get.return_value = mock_response
     
     url = find_contact_page("https://example.com")
     assert url == "https://example.com"
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
+def test_find_contact_page_keeps_link_case(mock_get):
+    """Test that matching is case-insensitive and the first link in document order wins."""
+    mock_get.return_value = html_response("""
+    <a href="/home">Home</a>
+    <a href="/Redazione/Staff">Staff</a>
+    <a href="/contact">Contact</a>
+    """)
+    
+    url = find_contact_page("https://example.com")
+    assert url == "https://example.com/Redazione/Staff"
+
+@patch('utils.SESSION.get')
+def test_find_contact_page_uses_cache(mock_get):
+    """Test that repeated contact page lookups are served from the cache."""
+    mock_response = html_response('<html><body><a href="/contact">Contact Us</a></body></html>')
+    mock_get.return_value = mock_response
+    
+    assert find_contact_page("https://example.com") == "https://example.com/contact"
+    assert find_contact_page("https://example.com") == "https://example.com/contact"
+    assert mock_get.call_count == 1
+
+@patch('utils.SESSION.get')
+def test_find_contact_page_probes_each_origin_once(mock_get):
+    """Test that pages on the same site share one homepage lookup."""
+    mock_get.return_value = html_response('<a href="/contact">Contatti</a>')
+    
+    assert find_contact_page("https://example.com/news/1") == "https://example.com/contact"
+    assert find_contact_page("https://example.com/news/2") == "https://example.com/contact"
+    assert mock_get.call_count == 1
+    assert mock_get.call_args[0][0] == "https://example.com"
+    
+    # Relative links cannot be resolved to a site and are returned unchanged
+    assert find_contact_page("/url?q=example") == "/url?q=example"
+    assert mock_get.call_count == 1
+
+@patch('utils.SESSION.get')
+def test_find_contact_page_does_not_cache_failed_fetch(mock_get):
+    """Test that a homepage that failed to load is fetched again on the next lookup."""
+    mock_get.side_effect = [
+        MagicMock(status_code=404, content=b"", encoding="utf-8", headers={}),
+        html_response('<a href="/contact">Contatti</a>'),
+    ]
+    
+    assert find_contact_page("https://example.com") == "https://example.com"
+    assert _cache_get("contact_pages", "https://example.com") is None
+    assert find_contact_page("https://example.com") == "https://example.com/contact"
+    assert mock_get.call_count == 2
+
+@patch('utils.HOST_REQUESTS_PER_SECOND', 1000.0)
+@patch('utils.SESSION.get')
+def test_find_contact_page_concurrent_lookups_share_fetch(mock_get):
+    """Test that concurrent lookups on the same site wait for one homepage fetch."""
+    def slow_homepage(url, **kwargs):
+        time.sleep(0.05)
+        return html_response('<a href="/contact">Contatti</a>')
+    mock_get.side_effect = slow_homepage
+    
+    urls = [f"https://techcrunch.com/news/{i}" for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        contact_urls = list(executor.map(find_contact_page, urls))
+    
+    assert contact_urls == ["https://techcrunch.com/contact"] * 8
+    assert mock_get.call_count == 1
+
+def test_cache_expiry():
+    """Test that cache entries are returned until their TTL expires."""
+    _cache_set("test", "key", {"articles": []}, ttl=60)
+    assert _cache_get("test", "key") == {"articles": []}
+    
+    _cache_set("test", "stale", "value", ttl=-1)
+    assert _cache_get("test", "stale") is None
+    assert _cache_get("test", "missing") is None
+
+def streamed_response(body: bytes, headers: dict = None) -> requests.Response:
+    """Build a real streamed response whose body is read from memory."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers or {})
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    return response
+
+@patch('utils.SESSION.get')
+def test_get_page_bounds_body_size(mock_get):
+    """Test that only the first MAX_PAGE_BYTES of a page are read."""
+    mock_get.return_value = streamed_response(b"a" * (MAX_PAGE_BYTES + 1000))
+    
+    response = _get_page("https://example.com")
+    assert len(response.content) == MAX_PAGE_BYTES
+    assert mock_get.call_args.kwargs["stream"] is True
+
+@patch('utils.SESSION.get')
+def test_get_page_skips_oversized_content_length(mock_get):
+    """Test that pages declaring a huge body are skipped without reading it."""
+    mock_get.return_value = streamed_response(b"<html></html>", {"Content-Length": str(10 * 1024 * 1024)})
+    
+    assert _get_page("https://example.com").content == b""
+
+@patch('utils.SESSION.get')
+def test_get_page_caches_slow_changing_hosts(mock_get):
+    """Test that pages from hosts with a cache TTL are served from disk on repeat fetches."""
+    body = "<p>Redazione – contatti</p>".encode('utf-8')
+    mock_get.side_effect = lambda *args, **kwargs: streamed_response(body)
+    
+    first = _get_page("https://www.odg.it/elenco-giornalisti/")
+    second = _get_page("https://www.odg.it/elenco-giornalisti/")
+    assert first.content == second.content == body
+    assert mock_get.call_count == 1
+    
+    # Other hosts are always fetched
+    _get_page("https://example.com")
+    _get_page("https://example.com")
+    assert mock_get.call_count == 3
+
+@patch('utils.SESSION.get')
 def test_search_recipients_technology_topic(mock_get):
     """Test searching for recipients with a technology topic."""
     # Mock Google search response
-    mock_response = MagicMock()
-    mock_response.text = """
+    mock_response = html_response("""
     <html>
         <body>
             <a href="https://techcrunch.com/author/john-doe">John Doe</a>
             <a href="https://wired.com/contact">Contact Us</a>
         </body>
     </html>
-    """
+    """)
     mock_get.return_value = mock_response
     
     recipients = search_recipients("technology startup")
     assert isinstance(recipients, list)
     assert any(r['platform'] in ['techcrunch.com', 'wired.com'] for r in recipients)
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_business_topic(mock_get):
     """Test searching for recipients with a business topic."""
     # Mock Google search response
-    mock_response = MagicMock()
-    mock_response.text = """
+    mock_response = html_response("""
     <html>
         <body>
             <a href="https://bloomberg.com/contact">Contact</a>
             <a href="https://reuters.com/editors">Editors</a>
         </body>
     </html>
-    """
+    """)
     mock_get.return_value = mock_response
     
     recipients = search_recipients("business news")
     assert isinstance(recipients, list)
     assert any(r['platform'] in ['bloomberg.com', 'reuters.com'] for r in recipients)
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_with_roles(mock_get):
     """Test extracting recipient roles."""
     # Mock contact page response
-    mock_response = MagicMock()
-    mock_response.text = """
+    mock_response = html_response("""
     <html>
         <body>
             <div>Senior Technology Editor John Smith</div>
             <div>Contact: john.smith@example.com</div>
         </body>
     </html>
-    """
+    """)
     mock_get.return_value = mock_response
     
     recipients = search_recipients("test topic")
     assert any(r['role'] == 'Senior' for r in recipients)
     assert any(r['role'] == 'Technology' for r in recipients)
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_name_matching(mock_get):
     """Test matching names with email addresses."""
     # Mock contact page response
-    mock_response = MagicMock()
-    mock_response.text = """
+    mock_response = html_response("""
     <html>
         <body>
             <div>Jane Doe - Senior Editor</div>
             <div>Email: jane.doe@example.com</div>
         </body>
     </html>
-    """
+    """)
     mock_get.return_value = mock_response
     
     recipients = search_recipients("test topic")
     assert any(r['name'] == 'Jane Doe' and r['email'] == 'jane.doe@example.com' for r in recipients)
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_relevance_sorting(mock_get):
     """Test recipient sorting by relevance."""
     # Mock responses for different platforms
     mock_responses = [
-        MagicMock(text='<a href="https://techcrunch.com">TechCrunch</a>'),
-        MagicMock(text='<a href="https://unknown.com">Unknown</a>')
+        html_response('<a href="https://techcrunch.com">TechCrunch</a>'),
+        html_response('<a href="https://unknown.com">Unknown</a>')
     ]
     mock_get.side_effect = mock_responses
     
@@ -158,18 +318,102 @@ def test_search_recipients_relevance_sorting(mock_get):
         if any(r['role'] for r in recipients):
             assert recipients[0]['role'] != ''
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_no_matches(mock_get):
     """Test behavior when no relevant recipients are found."""
     # Mock empty response
-    mock_response = MagicMock()
-    mock_response.text = "<html><body>No results</body></html>"
+    mock_response = html_response("<html><body>No results</body></html>")
     mock_get.return_value = mock_response
     
     recipients = search_recipients("nonexistent topic")
     assert isinstance(recipients, list)
     assert len(recipients) == 0
 
+@patch('utils.SESSION.get')
+def test_fetch_news_articles_single_request(mock_get):
+    """Test that News API articles come from one full-size page and are cached."""
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps({
+        'articles': [{'url': 'https://example.com/1', 'author': 'Author 1'}]
+    }))
+    
+    articles = _fetch_news_articles("tecnologia", "test_key")
+    assert [a['url'] for a in articles] == ['https://example.com/1']
+    assert mock_get.call_args.kwargs['params']['pageSize'] == 100
+    assert mock_get.call_count == 1
+    
+    assert _fetch_news_articles("tecnologia", "test_key") == articles
+    assert mock_get.call_count == 1
+
+@patch('utils.SESSION.get')
+def test_fetch_news_articles_failure_not_cached(mock_get):
+    """Test that a failed News API request is retried instead of being served from the cache."""
+    mock_get.side_effect = [
+        MagicMock(status_code=503, content=b""),
+        MagicMock(status_code=200, content=orjson.dumps({'articles': [{'url': 'https://example.com/1'}]})),
+    ]
+    
+    assert _fetch_news_articles("tecnologia", "test_key") is None
+    assert [a['url'] for a in _fetch_news_articles("tecnologia", "test_key")] == ['https://example.com/1']
+    assert mock_get.call_count == 2
+
+@patch('utils.HOST_REQUESTS_PER_SECOND', 1000.0)
+@patch('utils.SESSION.get')
+def test_search_recipients_fallback_deduplicates(mock_get):
+    """Test that the same email found across queries is only returned once."""
+    mock_response = html_response("""
+    <html>
+        <body>
+            <a href="https://techcrunch.com/contact">Contact</a>
+            <div>Senior Editor Jane Doe - jane@techcrunch.com / Jane@TechCrunch.com</div>
+        </body>
+    </html>
+    """)
+    mock_get.return_value = mock_response
+    
+    recipients = search_recipients_fallback("technology", {"techcrunch.com"})
+    assert [r['email'] for r in recipients] == ["jane@techcrunch.com"]
+    assert recipients[0]['platform'] == "techcrunch.com"
+    # One request per search query, then the shared result link is only followed once
+    assert mock_get.call_count == len(FALLBACK_QUERY_TEMPLATES) + 2
+
+def test_extract_role_prefers_job_title():
+    """Test that a job title wins over an earlier news beat on the same page."""
+    assert _extract_role("Technology desk - Senior Editor Jane Doe") == "Senior"
+    assert _extract_role("Technology and Business news") == "Technology"
+    assert _extract_role("No roles here") == ""
+    assert _extract_role(b"Technology desk - Senior Editor Jane Doe") == "Senior"
+    assert _extract_role(b"No roles here") == ""
+
+def test_token_bucket_waits_when_empty():
+    """Test that the rate limiter allows a burst and then waits for a refill."""
+    clock = [0.0]
+    
+    def fake_sleep(seconds):
+        clock[0] += seconds
+    
+    with patch('utils.time.monotonic', side_effect=lambda: clock[0]), \
+            patch('utils.time.sleep', side_effect=fake_sleep) as mock_sleep:
+        bucket = _TokenBucket(rate=1.0, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+        
+        bucket.acquire()
+        mock_sleep.assert_called_once_with(1.0)
+
+def test_rank_recipients():
+    """Test region tagging and relevance ordering of fallback recipients."""
+    recipients = [
+        {"name": "Unknown Author", "email": "a@x.com", "source": "https://example.com/a", "role": "", "platform": "unknown"},
+        {"name": "Jane Doe", "email": "b@x.de", "source": "https://news.example.de/b", "role": "Editor", "platform": "example.de"},
+        {"name": "Unknown Author", "email": "c@x.jp", "source": "https://example.co.jp", "role": "", "platform": "unknown"}
+    ]
+    
+    ranked = _rank_recipients(recipients)
+    assert [r['email'] for r in ranked] == ["b@x.de", "c@x.jp", "a@x.com"]
+    assert [r['region'] for r in ranked] == ["europe", "asia", "global"]
+    assert _rank_recipients([]) == []
+
 @patch('smtplib.SMTP')
 def test_send_email(mock_smtp, sample_recipients):
     """Test sending emails."""
@@ -181,7 +425,76 @@ def test_send_email(mock_smtp, sample_recipients):
     
     assert len(status) == len(sample_recipients)
     assert all(status.values())
-    mock_server.send_message.assert_called()
+    assert mock_server.sendmail.call_count == len(sample_recipients)
+    
+    # Each message carries its own recipient header on top of the shared body
+    messages = {call.args[1][0]: call.args[2] for call in mock_server.sendmail.call_args_list}
+    message = messages["test@example.com"]
+    assert b"To: test@example.com\r\n" in message
+    assert b"Subject: Press Release: Test Journalist\r\n" in message
+    assert b"Content-Type: text/plain" in message
+    assert b"multipart" not in message
+
+@patch('smtplib.SMTP')
+def test_send_email_uses_crlf_line_endings(mock_smtp):
+    """Test that the raw message handed to sendmail never contains a bare LF."""
+    mock_server = MagicMock()
+    mock_server.sendmail.return_value = {}
+    mock_smtp.return_value.__enter__.return_value = mock_server
+    recipients = [{"name": "Redazione Regione Autonoma Friuli Venezia Giulia e Trentino Alto Adige", "email": "a@example.com"}]
+    
+    send_email(recipients, "Primo paragrafo.\nSecondo paragrafo.\n")
+    
+    message = mock_server.sendmail.call_args.args[2]
+    assert re.search(rb'(?<!\r)\n', message) is None
+    assert b"\r\n\r\n" in message
+
+@patch('smtplib.SMTP')
+def test_send_email_batches_shared_subjects(mock_smtp):
+    """Test that recipients with the same subject share one message and refusals are reported."""
+    mock_server = MagicMock()
+    mock_server.sendmail.return_value = {"b@example.com": (550, b"No such user")}
+    mock_smtp.return_value.__enter__.return_value = mock_server
+    recipients = [
+        {"name": "Unknown Author", "email": "a@example.com"},
+        {"name": "Mario Rossi", "email": "mario@example.com"},
+        {"name": "Unknown Author", "email": "b@example.com"}
+    ]
+    
+    status = send_email(recipients, "Test press release")
+    
+    assert status == {"a@example.com": True, "mario@example.com": True, "b@example.com": False}
+    assert mock_server.sendmail.call_count == 2
+    messages = {tuple(call.args[1]): call.args[2] for call in mock_server.sendmail.call_args_list}
+    assert b"To: undisclosed-recipients:;\r\n" in messages[("a@example.com", "b@example.com")]
+    assert b"To: mario@example.com\r\n" in messages[("mario@example.com",)]
+
+@patch('smtplib.SMTP')
+def test_send_email_caps_recipients_per_message(mock_smtp):
+    """Test that a large group with one subject is split into envelopes of at most SMTP_MAX_RECIPIENTS."""
+    mock_server = MagicMock()
+    mock_server.sendmail.return_value = {}
+    mock_smtp.return_value.__enter__.return_value = mock_server
+    recipients = [{"name": "Unknown Author", "email": f"r{i}@example.com"} for i in range(120)]
+    
+    status = send_email(recipients, "Test press release")
+    
+    assert len(status) == 120 and all(status.values())
+    sizes = sorted(len(call.args[1]) for call in mock_server.sendmail.call_args_list)
+    assert sizes == [20, SMTP_MAX_RECIPIENTS, SMTP_MAX_RECIPIENTS]
+
+@patch('smtplib.SMTP_SSL')
+def test_send_email_implicit_tls(mock_smtp_ssl, sample_recipients, monkeypatch):
+    """Test that port 465 uses an implicit TLS connection without STARTTLS."""
+    monkeypatch.setenv("SMTP_PORT", "465")
+    mock_server = MagicMock()
+    mock_server.sendmail.return_value = {}
+    mock_smtp_ssl.return_value.__enter__.return_value = mock_server
+    
+    status = send_email(sample_recipients, "Test press release")
+    
+    assert all(status.values())
+    mock_server.starttls.assert_not_called()
 
 @patch('smtplib.SMTP')
 def test_send_email_failure(mock_smtp, sample_recipients):
@@ -194,13 +507,13 @@ def test_send_email_failure(mock_smtp, sample_recipients):
     assert len(status) == len(sample_recipients)
     assert not any(status.values())
 
-@patch('tweepy.API')
+@patch('tweepy.Client')
 @patch('linkedin_api.Linkedin')
 @patch('facebook.GraphAPI')
 def test_post_to_social_media(mock_facebook, mock_linkedin, mock_twitter):
     """Test posting to social media platforms."""
     # Mock successful posting
-    mock_twitter.return_value.update_status.return_value = True
+    mock_twitter.return_value.create_tweet.return_value = MagicMock(data={'id': '1'})
     mock_linkedin.return_value.post.return_value = True
     mock_facebook.return_value.put_object.return_value = True
     
@@ -210,13 +523,13 @@ def test_post_to_social_media(mock_facebook, mock_linkedin, mock_twitter):
     assert status["linkedin"] is True
     assert status["facebook"] is True
 
-@patch('tweepy.API')
+@patch('tweepy.Client')
 @patch('linkedin_api.Linkedin')
 @patch('facebook.GraphAPI')
 def test_post_to_social_media_partial_failure(mock_facebook, mock_linkedin, mock_twitter):
     """Test partial failure in social media posting."""
     # Mock Twitter success, LinkedIn failure, Facebook success
-    mock_twitter.return_value.update_status.return_value = True
+    mock_twitter.return_value.create_tweet.return_value = MagicMock(data={'id': '1'})
     mock_linkedin.side_effect = Exception("LinkedIn Error")
     mock_facebook.return_value.put_object.return_value = True
     
@@ -226,6 +539,16 @@ def test_post_to_social_media_partial_failure(mock_facebook, mock_linkedin, mock
     assert status["linkedin"] is False
     assert status["facebook"] is True
 
+def test_split_tweets_on_word_boundaries():
+    """Test that long press releases are split into tweets without cutting words."""
+    words = ["comunicato"] * 100
+    tweets = _split_tweets(" ".join(words))
+    
+    assert len(tweets) > 1
+    assert all(len(tweet) <= 280 for tweet in tweets)
+    assert " ".join(tweets).split() == words
+    assert _split_tweets("") == []
+
 def test_extract_email_from_text_with_invalid_emails():
     """Test email extraction with invalid email formats."""
     text = """
@@ -236,7 +559,7 @@ def test_extract_email_from_text_with_invalid_emails():
     assert len(emails) == 1
     assert "test@example.com" in emails 
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_with_news_api(mock_get):
     """Test searching for recipients using News API."""
     # Mock News API response
@@ -260,7 +583,7 @@ def test_search_recipients_with_news_api(mock_get):
     assert isinstance(recipients, list)
     assert any(r['platform'] in ['techcrunch.com', 'euractiv.com'] for r in recipients)
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_regional_diversity(mock_get):
     """Test regional diversity in recipient search."""
     # Mock News API response with articles from different regions
@@ -291,7 +614,7 @@ def test_search_recipients_regional_diversity(mock_get):
     assert any(r['region'] == 'europe' for r in recipients)
     assert any(r['region'] == 'latin_america' for r in recipients)
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_news_api_fallback(mock_get):
     """Test fallback to basic search when News API fails."""
     # Mock News API failure
@@ -303,7 +626,7 @@ def test_search_recipients_news_api_fallback(mock_get):
     assert isinstance(recipients, list)
     # Should still return results from fallback search
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_article_urls(mock_get):
     """Test inclusion of article URLs in recipient data."""
     # Mock News API response
@@ -322,7 +645,7 @@ def test_search_recipients_article_urls(mock_get):
     recipients = search_recipients("technology")
     assert any(r.get('article_url') == 'https://techcrunch.com/article1' for r in recipients)
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_platform_specific(mock_get):
     """Test platform-specific recipient search."""
     # Mock News API response with business-focused articles
@@ -346,11 +669,211 @@ def test_search_recipients_platform_specific(mock_get):
     assert any(r['platform'] == 'bloomberg.com' for r in recipients)
     assert any(r['platform'] == 'nikkei.com' for r in recipients)
 
-@patch('requests.get')
+@patch('utils.SESSION.get')
 def test_search_recipients_no_news_api_key(mock_get):
     """Test behavior when News API key is not set."""
     # Mock environment variable not set
     with patch.dict(os.environ, {}, clear=True):
         recipients = search_recipients("test topic")
         assert isinstance(recipients, list)
-        # Should fall back to basic search 
\ No newline at end of file
+        # Should fall back to basic search
+
+@patch('utils.groq_client')
+def test_extract_topics_is_cached(mock_groq):
+    """Test that topic extraction for the same text only calls Groq once."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content=" tecnologia, startup "))]
+    mock_groq.chat.completions.create.return_value = mock_response
+    
+    assert extract_topics("Comunicato stampa.") == "tecnologia, startup"
+    assert extract_topics("Comunicato stampa.") == "tecnologia, startup"
+    assert mock_groq.chat.completions.create.call_count == 1
+
+@patch('utils.groq_client')
+def test_extract_topics_failure_is_not_cached(mock_groq):
+    """Test that a failed extraction falls back to the first sentence and is retried later."""
+    mock_groq.chat.completions.create.side_effect = Exception("API Error")
+    
+    assert extract_topics("Primo. Secondo.") == "Primo"
+    assert extract_topics("Primo. Secondo.") == "Primo"
+    assert mock_groq.chat.completions.create.call_count == 2
+
+@pytest.mark.asyncio
+@patch('utils.async_groq_client')
+async def test_extract_topics_async_streams_and_caches(mock_groq):
+    """Test that async topic extraction assembles streamed chunks and reuses the cache."""
+    async def stream():
+        for delta in [" tecnologia", ", ", None, "startup "]:
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content=delta))])
+    
+    async def create(**kwargs):
+        assert kwargs['stream'] is True
+        return stream()
+    mock_groq.chat.completions.create = MagicMock(side_effect=create)
+    
+    assert await extract_topics_async("Comunicato stampa.") == "tecnologia, startup"
+    assert await extract_topics_async("Comunicato stampa.") == "tecnologia, startup"
+    assert mock_groq.chat.completions.create.call_count == 1
+
+@patch('utils.search_journalist_email')
+def test_search_journalist_emails_keeps_order(mock_search):
+    """Test that concurrent email lookups come back in input order."""
+    mock_search.side_effect = lambda name, publication: f"{name.lower()}@{publication or 'example.com'}"
+    
+    emails = _search_journalist_emails(["Mario", "Anna", "Luca", "Mario"], ["corriere.it", "", "ansa.it", "corriere.it"])
+    assert emails == ["mario@corriere.it", "anna@example.com", "luca@ansa.it", "mario@corriere.it"]
+    assert mock_search.call_count == 3
+    assert _search_journalist_emails([], []) == []
+
+@patch('utils.HOST_REQUESTS_PER_SECOND', 1000.0)
+@patch('utils.SESSION.get')
+def test_search_journalist_email_from_snippets(mock_get):
+    """Test that the first snippet email matching the journalist's name is returned."""
+    mock_get.return_value = html_response("""
+        <div class="g"><a href="https://corriere.it/redazione">Redazione</a>
+            <div class="VwiC3b">Scrivi a redazione@corriere.it</div></div>
+        <div class="g"><a href="https://corriere.it/autori">Autori</a>
+            <div class="VwiC3b">Contatti: mario.<em>rossi</em>@corriere.it, rossi.m@corriere.it</div></div>
+    """)
+    
+    assert search_journalist_email("Mario Rossi", "Corriere") == "mario.rossi@corriere.it"
+
+def test_host_slot_is_shared_per_host():
+    """Test that URLs on the same host share one concurrency slot."""
+    slot = _host_slot("https://example.com/a")
+    assert _host_slot("https://EXAMPLE.com/b") is slot
+    assert _host_slot("https://other.com/") is not slot
+
+@patch('utils.HOST_REQUESTS_PER_SECOND', 1000.0)
+@patch('utils.SESSION.get')
+def test_search_journalist_email_uses_search_api(mock_get, monkeypatch):
+    """Test that the search API's JSON results are used instead of scraping Google when configured."""
+    monkeypatch.setenv("SEARCH_API_KEY", "test_key")
+    mock_get.return_value = MagicMock(status_code=200, content=orjson.dumps({
+        "web": {"results": [
+            {"url": "https://corriere.it/autori", "description": "Contatti: mario.<strong>rossi</strong>@corriere.it"}
+        ]}
+    }))
+    
+    assert search_journalist_email("Mario Rossi", "Corriere") == "mario.rossi@corriere.it"
+    assert all(call.args[0] == SEARCH_API_URL for call in mock_get.call_args_list)
+
+@patch('utils.HOST_REQUESTS_PER_SECOND', 1000.0)
+@patch('utils.groq_client')
+@patch('utils.SESSION.get')
+def test_search_journalist_email_batches_refined_queries(mock_get, mock_groq):
+    """Test that refined queries come from a single Groq call and are all searched."""
+    mock_groq.chat.completions.create.return_value = MagicMock(choices=[MagicMock(message=MagicMock(
+        content='1. Mario Rossi giornalista\n2. "Mario Rossi firma email"\n- Mario Rossi redazione'
+    ))])
+    
+    def serp(url, **kwargs):
+        snippet = "mario.rossi@corriere.it" if "Rossi%20redazione" in url else "nessun contatto"
+        return html_response(f'<div class="g"><div class="VwiC3b">{snippet}</div></div>')
+    mock_get.side_effect = serp
+    
+    assert search_journalist_email("Mario Rossi", "Corriere") == "mario.rossi@corriere.it"
+    assert mock_groq.chat.completions.create.call_count == 1
+    searched = [call.args[0] for call in mock_get.call_args_list]
+    assert any("Mario%20Rossi%20firma%20email" in url for url in searched)
+    assert any("Mario%20Rossi%20redazione" in url for url in searched)
+
+@patch('utils._find_journalist_email')
+def test_search_journalist_email_is_cached(mock_find):
+    """Test that journalist lookups are memoized and found emails persist on disk."""
+    mock_find.return_value = "mario.rossi@corriere.it"
+    
+    assert search_journalist_email("Mario Rossi", "Corriere") == "mario.rossi@corriere.it"
+    assert search_journalist_email("Mario Rossi", "Corriere") == "mario.rossi@corriere.it"
+    assert mock_find.call_count == 1
+    
+    # A new run (empty in-memory cache) still reuses the on-disk result
+    _JOURNALIST_EMAILS.clear()
+    assert search_journalist_email("mario rossi", "corriere") == "mario.rossi@corriere.it"
+    assert mock_find.call_count == 1
+
+@patch('utils._find_journalist_email')
+def test_search_journalist_email_retries_misses(mock_find):
+    """Test that a journalist whose email was not found is searched again on the next call."""
+    mock_find.side_effect = ["", "mario.rossi@corriere.it"]
+    
+    assert search_journalist_email("Mario Rossi", "Corriere") == ""
+    assert search_journalist_email("Mario Rossi", "Corriere") == "mario.rossi@corriere.it"
+    assert mock_find.call_count == 2
+
+def test_create_tweet_waits_out_short_rate_limit():
+    """Test that a rate-limited tweet is retried once the limit window resets."""
+    rate_limited = tweepy.TooManyRequests(MagicMock(status_code=429, headers={"x-rate-limit-reset": "0"}))
+    client = MagicMock()
+    client.create_tweet.side_effect = [rate_limited, MagicMock(data={'id': '2'})]
+    
+    response = _create_tweet(client, "Comunicato", in_reply_to_tweet_id='1')
+    
+    assert response.data['id'] == '2'
+    assert client.create_tweet.call_count == 2
+    client.create_tweet.assert_called_with(text="Comunicato", in_reply_to_tweet_id='1')
+
+@patch('utils.facebook.GraphAPI')
+@patch('utils.Linkedin')
+def test_post_to_social_media_isolates_platform_failures(mock_linkedin, mock_graph, monkeypatch):
+    """Test that platforms are posted to independently when run concurrently."""
+    monkeypatch.setenv("LINKEDIN_USERNAME", "user")
+    monkeypatch.setenv("LINKEDIN_PASSWORD", "pass")
+    monkeypatch.setenv("FACEBOOK_PAGE_ID", "page")
+    monkeypatch.delenv("TWITTER_ACCESS_TOKEN_SECRET", raising=False)
+    mock_linkedin.side_effect = Exception("LinkedIn Error")
+    
+    status = post_to_social_media("Test press release")
+    
+    assert status == {'twitter': False, 'linkedin': False, 'facebook': True}
+    mock_graph.return_value.put_object.assert_called_once_with("page", "feed", message="Test press release")
+
+@patch('utils.search_journalist_email')
+@patch('utils.SESSION.get')
+def test_search_recipients_google_rate_limited_uses_directories(mock_get, mock_search, monkeypatch):
+    """Test that a rate-limited Google search still falls through to the journalist directories."""
+    monkeypatch.delenv("NEWS_API_KEY", raising=False)
+    mock_search.return_value = "mario.rossi@example.it"
+    
+    def respond(url, **kwargs):
+        if "google.com" in url:
+            return MagicMock(status_code=429, content=b"", encoding="utf-8")
+        return html_response('<div class="giornalista"><h3>Mario Rossi</h3></div>')
+    mock_get.side_effect = respond
+    
+    recipients = search_recipients(["tecnologia"])
+    
+    assert [r["name"] for r in recipients] == ["Mario Rossi"] * len(MEDIA_DIRECTORIES)
+    assert {r["email"] for r in recipients} == {"mario.rossi@example.it"}
+    
+    # A fetch error on the Google search falls through the same way
+    def fail_google(url, **kwargs):
+        if "google.com" in url:
+            raise requests.exceptions.RetryError("429")
+        return respond(url)
+    mock_get.side_effect = fail_google
+    assert len(search_recipients(["economia"])) == len(MEDIA_DIRECTORIES)
+
+@patch('utils.search_journalist_email')
+@patch('utils.SESSION.get')
+def test_search_recipients_latin1_directory(mock_get, mock_search, monkeypatch):
+    """Test that directory pages are decoded with the charset declared in their headers."""
+    monkeypatch.delenv("NEWS_API_KEY", raising=False)
+    mock_search.return_value = "niccolo.rossi@example.it"
+    
+    def respond(url, **kwargs):
+        if "google.com" in url:
+            return MagicMock(status_code=429, content=b"", encoding="utf-8", headers={})
+        return html_response('<div class="giornalista"><h3>Niccolò Rossi</h3></div>', charset='iso-8859-1')
+    mock_get.side_effect = respond
+    
+    recipients = search_recipients(["tecnologia"])
+    
+    assert recipients and all(r["name"] == "Niccolò Rossi" for r in recipients)
+
+def test_parse_html_detects_charset_without_header():
+    """Test that pages without a declared header charset fall back to Lexbor's own detection."""
+    html = '<html><head><meta charset="windows-1252"></head><body><h3>Niccolò Rossi</h3></body></html>'
+    response = MagicMock(content=html.encode('cp1252'), encoding='ISO-8859-1', headers={'Content-Type': 'text/html'})
+    
+    assert _parse_html(response).css_first('h3').text() == "Niccolò Rossi"
@@ -8,46 +8,387 @@ This module provides helper functions for:
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+import pandas as pd
 import smtplib
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.header import Header
+from email import policy
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Union
 import tweepy
 from linkedin_api import Linkedin
 import facebook
 import re
-from urllib.parse import urljoin
+import textwrap
+from urllib.parse import urljoin, urlparse
 import time
+import threading
 from urllib.parse import quote
-from groq import Groq
+from groq import Groq, AsyncGroq
 from dotenv import load_dotenv
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 import json
+import orjson
+import hashlib
+import base64
+from functools import lru_cache
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Configure logging
+# Configure logging; records are handed to a background thread through a queue so
+# file and console I/O never block the request loops
+_log_queue = queue.Queue(-1)
+_log_handlers = [
+    logging.FileHandler('press_release_agent.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = QueueHandler(_log_queue)
+# Only the message is rendered before queueing; the listener's handlers add the rest
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('press_release_agent.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[_queue_handler]
 )
 logger = logging.getLogger('press_release_agent')
 
 # Load environment variables
 load_dotenv()
 
+
 # Initialize Groq client    
 groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+async_groq_client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
 GROQ_MODEL = os.getenv("GROQ_MODEL", "mixtral-8x7b-32768")
 GROQ_TEMPERATURE = float(os.getenv("GROQ_TEMPERATURE", "0.7"))
+# A small, fast model is enough to return a comma-separated topic list
+GROQ_TOPICS_MODEL = os.getenv("GROQ_TOPICS_MODEL", "llama-3.1-8b-instant")
+# Groq calls allowed in flight at once across worker threads, to stay within rate limits
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "4"))
+_GROQ_SLOTS = threading.BoundedSemaphore(GROQ_MAX_CONCURRENCY)
+
+def _groq_completion(**kwargs):
+    """Helper function to create a Groq chat completion, bounded by GROQ_MAX_CONCURRENCY"""
+    with _GROQ_SLOTS:
+        return groq_client.chat.completions.create(**kwargs)
+
+# On-disk cache for quota-limited or slow lookups, next to the local storage fallback
+CACHE_DIR = Path("local_storage") / "cache"
+NEWS_API_CACHE_TTL = 6 * 3600  # News API free tier allows only 100 requests per day
+CONTACT_PAGE_CACHE_TTL = 24 * 3600
+TOPICS_CACHE_TTL = 24 * 3600
+JOURNALIST_EMAIL_CACHE_TTL = 7 * 24 * 3600
+# Scraped pages that change slowly are cached too, with a time-to-live per host
+PAGE_CACHE_TTLS = {
+    "www.google.com": 6 * 3600,
+    "www.odg.it": 7 * 24 * 3600,
+    "www.fnsi.it": 7 * 24 * 3600,
+}
+# A comma-separated topic list never needs more than this
+TOPICS_MAX_TOKENS = 60
+
+def _cache_path(namespace: str, key: str) -> Path:
+    """Helper function to map a cache key to its file path"""
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return CACHE_DIR / namespace / f"{digest}.json"
+
+def _cache_get(namespace: str, key: str):
+    """Helper function to read a cached value, returning None if missing or expired"""
+    try:
+        with open(_cache_path(namespace, key), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("expires", 0) < time.time():
+        return None
+    return entry.get("value")
+
+def _cache_set(namespace: str, key: str, value, ttl: int):
+    """Helper function to store a JSON-serializable value with a time-to-live in seconds"""
+    path = _cache_path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent, suffix='.tmp', delete=False) as f:
+            json.dump({"expires": time.time() + ttl, "value": value}, f)
+        os.replace(f.name, path)
+    except OSError as e:
+        logger.warning(f"Failed to write cache entry {namespace}/{key}: {str(e)}")
+
+# Browser headers sent with every request made through the shared session
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Shared HTTP session so repeated requests to the same host reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    # Once retries run out, return the last response so callers can check its status
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+)
+# Contact pages and directories are not always served over TLS
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+# Scraped HTML pages are read up to MAX_PAGE_BYTES; pages declaring more than
+# MAX_PAGE_CONTENT_LENGTH are skipped without downloading the body
+MAX_PAGE_BYTES = 512 * 1024
+MAX_PAGE_CONTENT_LENGTH = 2 * 1024 * 1024
+
+# Per-host request rate for scraping; each host gets its own token bucket so
+# different sites can be fetched in parallel while none of them is hammered
+HOST_REQUESTS_PER_SECOND = float(os.getenv("HOST_REQUESTS_PER_SECOND", "5"))
+HOST_BURST = int(os.getenv("HOST_BURST", "5"))
+# Requests to one host allowed in flight at once, so slow sites cannot tie up every worker
+HOST_MAX_CONCURRENCY = int(os.getenv("HOST_MAX_CONCURRENCY", "4"))
+
+# Link substrings that usually point to a contact or staff page, as one case-insensitive
+# selector so the parser returns the first matching link in document order
+CONTACT_PATTERNS = ("contact", "about", "staff", "team", "writers", "editors")
+CONTACT_LINK_SELECTOR = ", ".join(f'a[href*="{pattern}" i]' for pattern in CONTACT_PATTERNS)
+
+# Search result title keywords that identify Italian media contact pages
+MEDIA_CONTACT_KEYWORDS = ("giornalista", "redattore", "editore", "contatti", "rubrica")
+MEDIA_CONTACT_RE = re.compile("|".join(map(re.escape, MEDIA_CONTACT_KEYWORDS)), re.IGNORECASE)
+
+# Italian journalist directories used as the last-resort recipient source
+MEDIA_DIRECTORIES = (
+    "https://www.odg.it/elenco-giornalisti/",
+    "https://www.fnsi.it/elenco-giornalisti/"
+)
+
+# Query templates for the English-language fallback search
+FALLBACK_QUERY_TEMPLATES = (
+    "{topic} journalist contact",
+    "{topic} editor contact",
+    "{topic} reporter contact",
+    "{topic} news writer contact",
+    "{topic} media contact",
+    "{topic} press contact",
+    "{topic} publication contact"
+)
+
+# Email pattern with RFC length limits on each part so long runs of '.'/'-' cannot backtrack.
+# The lookbehind only lets a match start where a run of local-part characters starts,
+# so each run is tried once rather than once per character.
+EMAIL_RE = re.compile(r'(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]{1,64}@(?:[A-Za-z0-9-]{1,63}\.){1,8}[A-Za-z]{2,24}\b')
+EMAIL_BYTES_RE = re.compile(EMAIL_RE.pattern.encode('ascii'))
+
+# Name and role patterns scanned once per fallback contact page. NAME_RE covers
+# "First Last", "First Middle Last" and "First M. Last"; ROLE_RE prefers a job title
+# over a news beat, so the two are kept as separate named groups.
+NAME_RE = re.compile(r'[A-Z][a-z]+(?: [A-Z]\.)? [A-Z][a-z]+(?: [A-Z][a-z]+)?')
+ROLE_RE = re.compile(
+    r'(?P<title>Senior|Junior|Associate|Lead|Chief|Editor|Writer|Reporter|Journalist|Author)'
+    r'|(?P<beat>Technology|Business|Science|Health|Politics|Sports|Arts|Culture)'
+)
+# Byte versions scan contact pages without decoding them; the patterns are ASCII-only
+NAME_BYTES_RE = re.compile(NAME_RE.pattern.encode('ascii'))
+ROLE_BYTES_RE = re.compile(ROLE_RE.pattern.encode('ascii'))
+
+# Concurrent requests used by the fallback crawl
+FALLBACK_MAX_WORKERS = 8
+
+# Web search API used by search_journalist_email when SEARCH_API_KEY is set;
+# Google results are scraped otherwise
+SEARCH_API_URL = "https://api.search.brave.com/res/v1/web/search"
+SEARCH_API_RESULTS = 10
+# Search API descriptions highlight query terms with inline tags
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+# Charset parameter of a Content-Type header
+CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Numbering or bullets in front of each line of an LLM-generated query list
+QUERY_LIST_MARKER_RE = re.compile(r'^\s*(?:\d+[.)]|[-*\u2022])\s*')
+
+# Concurrent journalist email lookups in search_recipients
+JOURNALIST_SEARCH_MAX_WORKERS = 8
+
+# News API search endpoint; one request at the maximum page size uses the least daily quota
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+NEWS_API_PAGE_SIZE = 100
+
+# Per-recipient headers prepended to the shared, pre-serialized press release body
+EMAIL_HEADER_TEMPLATE = "To: {to}\r\nSubject: {subject}\r\n"
+# Most relays refuse RCPT TO beyond 50-100 recipients per message (RFC 5321 only guarantees 100)
+SMTP_MAX_RECIPIENTS = 50
+
+# Maximum characters per tweet
+TWEET_MAX_LENGTH = 280
+# Longest Twitter rate limit reset worth waiting for before giving up on a thread
+TWITTER_MAX_RATE_LIMIT_WAIT = 60
+
+# Top-level domain to region mapping used to tag recipient sources
+TLD_REGION = {
+    "eu": "europe", "de": "europe", "fr": "europe", "uk": "europe",
+    "cn": "asia", "jp": "asia", "kr": "asia", "in": "asia", "sg": "asia",
+    "br": "latin_america", "ar": "latin_america", "cl": "latin_america", "es": "latin_america"
+}
+
+class _TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second up to `capacity`"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+_HOST_LIMITERS: Dict[str, _TokenBucket] = {}
+_HOST_LIMITERS_LOCK = threading.Lock()
+
+def _throttle(url: str):
+    """Helper function to wait for the per-host rate limit before requesting a URL"""
+    host = urlparse(url).netloc.lower()
+    with _HOST_LIMITERS_LOCK:
+        limiter = _HOST_LIMITERS.get(host)
+        if limiter is None:
+            limiter = _HOST_LIMITERS[host] = _TokenBucket(HOST_REQUESTS_PER_SECOND, HOST_BURST)
+    limiter.acquire()
+
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    """Helper function to get the semaphore bounding concurrent requests to a URL's host"""
+    host = urlparse(url).netloc.lower()
+    with _HOST_LIMITERS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(HOST_MAX_CONCURRENCY)
+    return slot
+
+def _cached_page(url: str, entry: Dict[str, str]) -> requests.Response:
+    """Helper function to rebuild a response from a cached page body"""
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.encoding = entry["encoding"]
+    if entry.get("content_type"):
+        response.headers["Content-Type"] = entry["content_type"]
+    response._content = base64.b64decode(entry["body"])
+    response._content_consumed = True
+    return response
+
+def _get_page(url: str, timeout: int = 10) -> requests.Response:
+    """Helper function to GET an HTML page through the shared session with a bounded body size"""
+    cache_ttl = PAGE_CACHE_TTLS.get(urlparse(url).netloc.lower())
+    if cache_ttl:
+        entry = _cache_get("pages", url)
+        if entry is not None:
+            logger.info(f"Using cached page: {url}")
+            return _cached_page(url, entry)
+    
+    with _host_slot(url):
+        _throttle(url)
+        response = SESSION.get(url, timeout=timeout, stream=True)
+        try:
+            declared_length = int(response.headers.get("Content-Length") or 0)
+            if declared_length > MAX_PAGE_CONTENT_LENGTH:
+                logger.warning(f"Skipping oversized page ({declared_length} bytes): {url}")
+                body = b""
+            else:
+                body = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+        finally:
+            response.close()
+    
+    # Expose the bounded body through the regular response.content API
+    response._content = body
+    response._content_consumed = True
+    
+    if cache_ttl and response.status_code == 200 and response.content:
+        entry = {
+            "encoding": response.encoding,
+            "content_type": response.headers.get("Content-Type", ""),
+            "body": base64.b64encode(response.content).decode('ascii')
+        }
+        _cache_set("pages", url, entry, cache_ttl)
+    return response
+
+def _response_text(response: requests.Response) -> str:
+    """Helper function to decode a body once with the declared charset, skipping charset detection"""
+    try:
+        return response.content.decode(response.encoding or 'utf-8', errors='ignore')
+    except LookupError:
+        return response.content.decode('utf-8', errors='ignore')
+
+def _parse_html(response: requests.Response) -> LexborHTMLParser:
+    """Helper function to parse an HTML body, decoding it with the charset from the headers when one is declared"""
+    if CHARSET_RE.search(response.headers.get("Content-Type") or ""):
+        return LexborHTMLParser(_response_text(response))
+    # Lexbor reads raw bytes as UTF-8 unless asked to detect the encoding itself
+    return LexborHTMLParser(response.content, encoding=True)
+
+def _extract_role_match(pattern: re.Pattern, text):
+    """Helper function to scan text with a role pattern, preferring a job title over a beat"""
+    beat = text[:0]
+    for match in pattern.finditer(text):
+        if match.group("title"):
+            return match.group("title")
+        if not beat:
+            beat = match.group("beat")
+    return beat
+
+def _extract_role(text: Union[str, bytes]) -> str:
+    """Helper function to find the first job title on a page, or else the first news beat"""
+    if isinstance(text, bytes):
+        return _extract_role_match(ROLE_BYTES_RE, text).decode('ascii')
+    return _extract_role_match(ROLE_RE, text)
+
+def _rank_recipients(recipients: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Helper function to tag regions and sort recipients by relevance over the whole batch"""
+    if not recipients:
+        return recipients
+    
+    df = pd.DataFrame(recipients)
+    
+    # Classify the source host's top-level domain into a region
+    hosts = df["source"].str.extract(r"^[a-zA-Z][a-zA-Z0-9+.-]*://([^/:?#]+)", expand=False)
+    tlds = hosts.str.rsplit(".", n=1).str[-1].str.lower()
+    df["region"] = tlds.map(TLD_REGION).fillna("global")
+    
+    # Relevance score: known platform > role > named author > regional outlet
+    score = (
+        (df["platform"] != "unknown").astype(int) * 8
+        + df["role"].astype(bool).astype(int) * 4
+        + (df["name"] != "Unknown Author").astype(int) * 2
+        + (df["region"] != "global").astype(int)
+    )
+    order = score.sort_values(ascending=False, kind="stable").index
+    return df.loc[order].to_dict("records")
 
 def log_api_call(service: str, endpoint: str, params: dict, response: any, error: Exception = None):
     """Helper function to log API calls and responses"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_data = {
         "timestamp": datetime.now().isoformat(),
         "service": service,
@@ -56,7 +397,7 @@ def log_api_call(service: str, endpoint: str, params: dict, response: any, error
         "response": str(response) if response else None,
         "error": str(error) if error else None
     }
-    logger.info(f"API Call: {json.dumps(log_data, indent=2)}")
+    logger.info(f"API Call: {json.dumps(log_data, separators=(',', ':'))}")
 
 def extract_email_from_text(text: str) -> List[str]:
     """
@@ -68,15 +409,73 @@ def extract_email_from_text(text: str) -> List[str]:
     Returns:
         List[str]: List of unique email addresses found in the text
     """
-    logger.info(f"Extracting emails from text (length: {len(text)})")
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    emails = list(set(re.findall(email_pattern, text)))
-    logger.info(f"Found {len(emails)} unique email addresses")
+    log_info = logger.isEnabledFor(logging.INFO)
+    if log_info:
+        logger.info(f"Extracting emails from text (length: {len(text)})")
+    # Stream matches into a set so duplicates are never accumulated in a list
+    emails = list({match.group() for match in EMAIL_RE.finditer(text)})
+    if log_info:
+        logger.info(f"Found {len(emails)} unique email addresses")
     return emails
 
+def extract_email_from_bytes(content: bytes) -> List[str]:
+    """
+    Extract email addresses directly from a raw (undecoded) response body.
+    
+    Args:
+        content (bytes): The raw page content to search for email addresses
+        
+    Returns:
+        List[str]: List of unique email addresses in order of first appearance
+    """
+    return list(dict.fromkeys(match.group().decode('ascii') for match in EMAIL_BYTES_RE.finditer(content)))
+
+# Contact pages found per origin for this process; failed homepage fetches are left out
+_CONTACT_PAGES: Dict[str, str] = {}
+_CONTACT_PAGES_LOCK = threading.Lock()
+# One lock per origin, so concurrent lookups of the same site share a single homepage fetch
+_CONTACT_PAGE_LOCKS: Dict[str, threading.Lock] = {}
+
+def _contact_page_for_origin(origin: str) -> str:
+    """Helper function to find the contact page linked from a site's homepage, or "" if there is none"""
+    with _CONTACT_PAGES_LOCK:
+        cached = _CONTACT_PAGES.get(origin)
+        origin_lock = _CONTACT_PAGE_LOCKS.setdefault(origin, threading.Lock())
+    if cached is not None:
+        return cached
+    
+    with origin_lock:
+        # Another worker may have finished the lookup while this one waited
+        with _CONTACT_PAGES_LOCK:
+            cached = _CONTACT_PAGES.get(origin)
+        if cached is not None:
+            return cached
+        
+        cached = _cache_get("contact_pages", origin)
+        if cached is not None:
+            logger.info(f"Using cached contact page for: {origin}")
+            contact_url = cached
+        else:
+            response = _get_page(origin)
+            log_api_call("web", origin, {}, response)
+            
+            tree = _parse_html(response)
+            
+            link = tree.css_first(CONTACT_LINK_SELECTOR)
+            contact_url = urljoin(origin + "/", link.attributes['href']) if link else ""
+            # Only a homepage that actually loaded tells us whether the site has a contact page
+            if response.status_code != 200 or not response.content:
+                return contact_url
+            _cache_set("contact_pages", origin, contact_url, CONTACT_PAGE_CACHE_TTL)
+        
+        with _CONTACT_PAGES_LOCK:
+            _CONTACT_PAGES[origin] = contact_url
+    return contact_url
+
 def find_contact_page(url: str) -> str:
     """
     Find the contact page URL from a website's homepage.
+    Lookups are cached per origin once the homepage loads, so each site is only probed once.
     
     Args:
         url (str): The website's homepage URL
@@ -85,28 +484,15 @@ def find_contact_page(url: str) -> str:
         str: The URL of the contact page or the original URL if not found
     """
     logger.info(f"Searching for contact page at: {url}")
+    parsed = urlparse(url)
+    if not parsed.scheme or not parsed.netloc:
+        logger.info("Not an absolute URL, returning original URL")
+        return url
     try:
-        response = requests.get(url, timeout=10)
-        log_api_call("web", url, {}, response)
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Common contact page patterns
-        contact_patterns = [
-            r'contact',
-            r'about',
-            r'staff',
-            r'team',
-            r'writers',
-            r'editors'
-        ]
-        
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '').lower()
-            if any(pattern in href for pattern in contact_patterns):
-                contact_url = urljoin(url, href)
-                logger.info(f"Found contact page: {contact_url}")
-                return contact_url
+        contact_url = _contact_page_for_origin(f"{parsed.scheme}://{parsed.netloc}")
+        if contact_url:
+            logger.info(f"Found contact page: {contact_url}")
+            return contact_url
         
         logger.info("No contact page found, returning original URL")
         return url
@@ -114,102 +500,118 @@ def find_contact_page(url: str) -> str:
         logger.error(f"Error finding contact page: {str(e)}")
         return url
 
-def search_journalist_email(name: str, publication: str = "") -> str:
-    """
-    Search for a journalist's email address using their name and publication.
-    Uses web search and Groq LLM to refine search queries until an email is found.
+def _web_search(query: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Helper function to run a web search, returning the result snippets as one text and the first result link"""
+    search_api_key = os.getenv("SEARCH_API_KEY")
+    if search_api_key:
+        try:
+            params = {"q": query, "count": SEARCH_API_RESULTS}
+            response = SESSION.get(
+                SEARCH_API_URL,
+                params=params,
+                headers={"Accept": "application/json", "X-Subscription-Token": search_api_key},
+                timeout=10
+            )
+            log_api_call("search_api", SEARCH_API_URL, params, response)
+            if response.status_code == 200:
+                results = orjson.loads(response.content).get("web", {}).get("results", [])
+                snippets_text = HTML_TAG_RE.sub("", "\n".join(result.get("description", "") for result in results))
+                return snippets_text, results[0].get("url") if results else None
+            logger.warning(f"Search API returned status {response.status_code}, falling back to Google")
+        except Exception as e:
+            logger.error(f"Error calling search API, falling back to Google: {str(e)}")
     
-    Args:
-        name (str): The journalist's name
-        publication (str): The publication they work for (optional)
-        
-    Returns:
-        str: The found email address or empty string if not found
-    """
+    search_url = f"https://www.google.com/search?q={quote(query)}"
+    response = _get_page(search_url)
+    log_api_call("google_search", search_url, {"query": query}, response)
+    if response.status_code != 200:
+        return None
+    
+    tree = _parse_html(response)
+    snippets_text = "\n".join(snippet.text() for snippet in tree.css("div.g div.VwiC3b"))
+    link = tree.css_first("div.g a[href]")
+    return snippets_text, link.attributes.get("href") if link else None
+
+def _find_journalist_email(name: str, publication: str) -> str:
+    """Helper function to search the web for a journalist's email, refining queries with Groq"""
     logger.info(f"Starting email search for journalist: {name} at {publication}")
+    name_parts = name.lower().split()
     
     def perform_web_search(query: str) -> str:
         """Helper function to perform web search and extract emails"""
         logger.info(f"Performing web search with query: {query}")
         try:
-            search_url = f"https://www.google.com/search?q={quote(query)}"
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            
-            response = requests.get(search_url, headers=headers, timeout=10)
-            log_api_call("google_search", search_url, {"query": query}, response)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
+            results = _web_search(query)
+            if results is not None:
+                snippets_text, first_link = results
                 
-                # Look for email addresses in search results
-                for result in soup.find_all("div", class_="g"):
-                    snippet = result.find("div", class_="VwiC3b")
-                    if snippet:
-                        snippet_text = snippet.get_text()
-                        emails = extract_email_from_text(snippet_text)
+                # Scan all result snippets with a single regex pass, in page order
+                for match in EMAIL_RE.finditer(snippets_text):
+                    email = match.group()
+                    if any(part in email.lower() for part in name_parts):
+                        logger.info(f"Found matching email in search results: {email}")
+                        return email
+                
+                # If no email found in snippets, try visiting the first result
+                if first_link:
+                    try:
+                        contact_url = find_contact_page(first_link)
+                        contact_response = _get_page(contact_url)
+                        log_api_call("web", contact_url, {}, contact_response)
+                        
+                        emails = extract_email_from_text(_response_text(contact_response))
                         for email in emails:
-                            name_parts = name.lower().split()
                             if any(part in email.lower() for part in name_parts):
-                                logger.info(f"Found matching email in search results: {email}")
+                                logger.info(f"Found matching email on contact page: {email}")
                                 return email
-                
-                # If no email found in snippets, try visiting the first result
-                first_result = soup.find("div", class_="g")
-                if first_result:
-                    link = first_result.find("a")
-                    if link and link.get("href"):
-                        try:
-                            contact_url = find_contact_page(link["href"])
-                            contact_response = requests.get(contact_url, headers=headers, timeout=10)
-                            log_api_call("web", contact_url, {}, contact_response)
-                            
-                            emails = extract_email_from_text(contact_response.text)
-                            for email in emails:
-                                if any(part in email.lower() for part in name_parts):
-                                    logger.info(f"Found matching email on contact page: {email}")
-                                    return email
-                        except Exception as e:
-                            logger.error(f"Error visiting contact page: {str(e)}")
+                    except Exception as e:
+                        logger.error(f"Error visiting contact page: {str(e)}")
         except Exception as e:
             logger.error(f"Error performing web search: {str(e)}")
         return ""
 
-    def generate_search_query(name: str, publication: str, previous_queries: List[str]) -> str:
-        """Use Groq to generate an optimized search query"""
-        logger.info(f"Generating search query for {name} at {publication}")
+    def generate_search_queries(name: str, publication: str, previous_queries: List[str], count: int) -> List[str]:
+        """Use Groq to generate several distinct optimized search queries in one call"""
+        logger.info(f"Generating {count} search queries for {name} at {publication}")
         try:
-            prompt = f"""Generate a Google search query to find the email address of a journalist.
+            prompt = f"""Generate {count} Google search queries to find the email address of a journalist.
 Journalist name: {name}
 Publication: {publication}
 
 Previous unsuccessful queries:
 {chr(10).join(previous_queries)}
 
-Generate a new, more specific search query that might help find the journalist's email address.
+Generate {count} new, more specific and distinct search queries that might help find the journalist's email address.
 Focus on:
 1. Including specific terms that might appear on contact pages
 2. Using the journalist's full name and publication
 3. Including terms like "contact", "email", "staff", "team"
 4. Avoiding previous unsuccessful approaches
 
-Return ONLY the search query, nothing else."""
+Return ONLY the search queries, one per line, nothing else."""
 
-            response = groq_client.chat.completions.create(
+            response = _groq_completion(
                 model=GROQ_MODEL,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.7,
-                max_tokens=100
+                max_tokens=60 * count
             )
             
-            query = response.choices[0].message.content.strip()
-            log_api_call("groq", "chat/completions", {"prompt": prompt}, query)
-            logger.info(f"Generated new search query: {query}")
-            return query
+            content = response.choices[0].message.content
+            log_api_call("groq", "chat/completions", {"prompt": prompt}, content)
+            
+            # Drop list markers and quotes the model may add, and anything already tried
+            queries = []
+            for line in content.splitlines():
+                query = QUERY_LIST_MARKER_RE.sub("", line).strip().strip('"')
+                if query and query not in previous_queries and query not in queries:
+                    queries.append(query)
+            queries = queries[:count]
+            logger.info(f"Generated new search queries: {queries}")
+            return queries
         except Exception as e:
-            logger.error(f"Error generating search query: {str(e)}")
-            return ""
+            logger.error(f"Error generating search queries: {str(e)}")
+            return []
 
     try:
         # Initial search queries
@@ -223,30 +625,25 @@ Return ONLY the search query, nothing else."""
         previous_queries = []
         max_attempts = 5  # Maximum number of LLM-refined queries to try
         
-        # Try initial queries first
-        for query in initial_queries:
-            logger.info(f"Trying initial query: {query}")
-            email = perform_web_search(query)
-            if email:
-                logger.info(f"Successfully found email with initial query: {email}")
-                return email
-            previous_queries.append(query)
+        # Try initial queries first, all at once; the first query in order that finds an email wins
+        with ThreadPoolExecutor(max_workers=len(initial_queries)) as executor:
+            for query, email in zip(initial_queries, executor.map(perform_web_search, initial_queries)):
+                if email:
+                    logger.info(f"Successfully found email with initial query: {email}")
+                    return email
+                previous_queries.append(query)
         
-        # If no email found, use Groq to generate refined queries
-        for attempt in range(max_attempts):
-            logger.info(f"Attempting LLM-refined query {attempt + 1}/{max_attempts}")
-            new_query = generate_search_query(name, publication, previous_queries)
-            if not new_query:
-                logger.info("No new query generated, stopping search")
-                break
-                
-            email = perform_web_search(new_query)
-            if email:
-                logger.info(f"Successfully found email with refined query: {email}")
-                return email
-                
-            previous_queries.append(new_query)
-            time.sleep(1)  # Small delay between attempts
+        # If no email found, have Groq generate all refined queries in one call and try them at once
+        refined_queries = generate_search_queries(name, publication, previous_queries, max_attempts)
+        if not refined_queries:
+            logger.info("No new queries generated, stopping search")
+            return ""
+        
+        with ThreadPoolExecutor(max_workers=len(refined_queries)) as executor:
+            for email in executor.map(perform_web_search, refined_queries):
+                if email:
+                    logger.info(f"Successfully found email with refined query: {email}")
+                    return email
         
         logger.info("No email found after all attempts")
         return ""
@@ -254,6 +651,86 @@ Return ONLY the search query, nothing else."""
         logger.error(f"Error searching for journalist email: {str(e)}")
         return ""
 
+# Found journalist emails for this process; misses are left out so they are retried
+_JOURNALIST_EMAILS: Dict[str, str] = {}
+_JOURNALIST_EMAILS_LOCK = threading.Lock()
+
+def search_journalist_email(name: str, publication: str = "") -> str:
+    """
+    Search for a journalist's email address using their name and publication.
+    Uses web search and Groq LLM to refine search queries until an email is found.
+    Found emails are memoized for the process and cached on disk; misses are not.
+    
+    Args:
+        name (str): The journalist's name
+        publication (str): The publication they work for (optional)
+        
+    Returns:
+        str: The found email address or empty string if not found
+    """
+    cache_key = f"{name.strip().lower()}|{publication.strip().lower()}"
+    with _JOURNALIST_EMAILS_LOCK:
+        email = _JOURNALIST_EMAILS.get(cache_key)
+    if email:
+        return email
+    
+    email = _cache_get("journalist_emails", cache_key)
+    if email:
+        logger.info(f"Using cached email for journalist {name}: {email}")
+    else:
+        email = _find_journalist_email(name, publication)
+        # A miss may be a transient search failure, so it is never remembered
+        if not email:
+            return ""
+        _cache_set("journalist_emails", cache_key, email, JOURNALIST_EMAIL_CACHE_TTL)
+    
+    with _JOURNALIST_EMAILS_LOCK:
+        _JOURNALIST_EMAILS[cache_key] = email
+    return email
+
+def _search_journalist_emails(names: List[str], publications: List[str]) -> List[str]:
+    """Helper function to search several journalists' emails concurrently, in input order"""
+    if not names:
+        return []
+    # The same author often wrote several articles, so search each journalist only once
+    journalists = list(dict.fromkeys(zip(names, publications)))
+    for name, _ in journalists:
+        logger.info(f"Searching for email for journalist: {name}")
+    with ThreadPoolExecutor(max_workers=min(JOURNALIST_SEARCH_MAX_WORKERS, len(journalists))) as executor:
+        emails = dict(zip(journalists, executor.map(lambda journalist: search_journalist_email(*journalist), journalists)))
+    return [emails[journalist] for journalist in zip(names, publications)]
+
+def _fetch_news_articles(search_query: str, news_api_key: str, language: str = "it") -> Optional[List[Dict]]:
+    """Helper function to fetch News API articles for a query, or None if the request failed"""
+    # Reuse recent results for the same query to save News API quota
+    cache_key = f"{language}:{search_query}"
+    articles = _cache_get("news_api", cache_key)
+    if articles is not None:
+        logger.info("Using cached News API response")
+        return articles
+    
+    params = {
+        "q": search_query,
+        "language": language,
+        "sortBy": "relevancy",
+        "pageSize": NEWS_API_PAGE_SIZE,
+        "page": 1,
+        "apiKey": news_api_key
+    }
+    try:
+        response = SESSION.get(NEWS_API_URL, params=params, timeout=10)
+        log_api_call("news_api", NEWS_API_URL, params, response)
+        if response.status_code != 200:
+            return None
+        # Parse the raw body directly, skipping requests' encoding detection
+        articles = orjson.loads(response.content).get("articles", [])
+    except Exception as e:
+        logger.error(f"Error fetching News API articles: {str(e)}")
+        return None
+    
+    _cache_set("news_api", cache_key, articles, NEWS_API_CACHE_TTL)
+    return articles
+
 def search_recipients(topics: List[str], country: str = "it") -> List[Dict[str, str]]:
     """
     Search for relevant recipients based on multiple topics using News API and web search.
@@ -275,35 +752,29 @@ def search_recipients(topics: List[str], country: str = "it") -> List[Dict[str,
             logger.info("Attempting to use News API")
             # Combine topics for search
             search_query = " OR ".join(topics)
-            url = f"https://newsapi.org/v2/everything"
-            params = {
-                "q": search_query,
-                "language": "it",
-                "sortBy": "relevancy",
-                "apiKey": news_api_key
-            }
-            
-            response = requests.get(url, params=params)
-            log_api_call("news_api", url, params, response)
+            articles = _fetch_news_articles(search_query, news_api_key)
             
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Found {len(data.get('articles', []))} articles from News API")
-                for article in data.get("articles", []):
-                    if article.get("author"):
-                        recipient = {
-                            "name": article["author"],
-                            "role": "Giornalista",
-                            "email": "",  # News API doesn't provide email
-                            "publication": article.get("source", {}).get("name", ""),
-                            "focus": f"Articoli su {', '.join(topics)}"
-                        }
-                        # Search for email if not provided
-                        if not recipient["email"]:
-                            logger.info(f"Searching for email for journalist: {recipient['name']}")
-                            recipient["email"] = search_journalist_email(recipient["name"], recipient["publication"])
-                        recipients.append(recipient)
-                        logger.info(f"Added recipient: {recipient['name']} ({recipient['email']})")
+            if articles is not None:
+                logger.info(f"Found {len(articles)} articles from News API")
+                found = [
+                    {
+                        "name": article["author"],
+                        "role": "Giornalista",
+                        "email": "",  # News API doesn't provide email
+                        "publication": article.get("source", {}).get("name", ""),
+                        "focus": f"Articoli su {', '.join(topics)}"
+                    }
+                    for article in articles if article.get("author")
+                ]
+                # Search for all emails concurrently, since News API doesn't provide them
+                emails = _search_journalist_emails(
+                    [recipient["name"] for recipient in found],
+                    [recipient["publication"] for recipient in found]
+                )
+                for recipient, email in zip(found, emails):
+                    recipient["email"] = email
+                    recipients.append(recipient)
+                    logger.info(f"Added recipient: {recipient['name']} ({recipient['email']})")
         
         # If no results from News API or no API key, use web search
         if not recipients:
@@ -312,28 +783,30 @@ def search_recipients(topics: List[str], country: str = "it") -> List[Dict[str,
             search_query = f"{' OR '.join(topics)} giornalisti italiani contatti"
             search_url = f"https://www.google.com/search?q={quote(search_query)}"
             
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            
-            response = requests.get(search_url, headers=headers)
-            log_api_call("google_search", search_url, {"query": search_query}, response)
+            # A failed search must not skip the directory fallback below
+            try:
+                response = _get_page(search_url)
+                log_api_call("google_search", search_url, {"query": search_query}, response)
+            except Exception as e:
+                logger.error(f"Error searching Google for recipients: {str(e)}")
+                response = None
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
+            if response is not None and response.status_code == 200:
+                tree = _parse_html(response)
+                found = []
                 
                 # Look for contact information in search results
-                for result in soup.find_all("div", class_="g"):
-                    title = result.find("h3")
+                for result in tree.css("div.g"):
+                    title = result.css_first("h3")
                     if title:
-                        title_text = title.get_text()
+                        title_text = title.text()
                         # Check if it's a media contact page
-                        if any(keyword in title_text.lower() for keyword in ["giornalista", "redattore", "editore", "contatti", "rubrica"]):
-                            snippet = result.find("div", class_="VwiC3b")
+                        if MEDIA_CONTACT_RE.search(title_text):
+                            snippet = result.css_first("div.VwiC3b")
                             if snippet:
-                                snippet_text = snippet.get_text()
+                                snippet_text = snippet.text()
                                 # Extract potential contact information
-                                email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', snippet_text)
+                                email_match = EMAIL_RE.search(snippet_text)
                                 recipient = {
                                     "name": title_text,
                                     "role": "Giornalista",
@@ -341,47 +814,56 @@ def search_recipients(topics: List[str], country: str = "it") -> List[Dict[str,
                                     "publication": "Da determinare",
                                     "focus": f"Articoli su {', '.join(topics)}"
                                 }
-                                # Search for email if not found in snippet
-                                if not recipient["email"]:
-                                    logger.info(f"Searching for email for journalist: {recipient['name']}")
-                                    recipient["email"] = search_journalist_email(recipient["name"])
-                                recipients.append(recipient)
-                                logger.info(f"Added recipient: {recipient['name']} ({recipient['email']})")
+                                found.append(recipient)
+                
+                # Search concurrently for the emails not found in snippets
+                missing = [recipient for recipient in found if not recipient["email"]]
+                emails = _search_journalist_emails([recipient["name"] for recipient in missing], [""] * len(missing))
+                for recipient, email in zip(missing, emails):
+                    recipient["email"] = email
+                for recipient in found:
+                    recipients.append(recipient)
+                    logger.info(f"Added recipient: {recipient['name']} ({recipient['email']})")
         
         # If still no results, try searching Italian media directories
         if not recipients:
             logger.info("No results from web search, trying media directories")
-            media_directories = [
-                "https://www.odg.it/elenco-giornalisti/",
-                "https://www.fnsi.it/elenco-giornalisti/"
-            ]
             
-            for directory in media_directories:
+            def fetch_directory(directory: str) -> List[str]:
+                """Helper function to list the journalist names found in a media directory"""
                 try:
                     logger.info(f"Searching directory: {directory}")
-                    response = requests.get(directory, headers=headers)
+                    response = _get_page(directory)
                     log_api_call("web", directory, {}, response)
                     
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, "html.parser")
+                        tree = _parse_html(response)
                         # Look for journalists in the directory
-                        for journalist in soup.find_all("div", class_=["giornalista", "member", "contact"]):
-                            name = journalist.find("h3") or journalist.find("strong")
+                        names = []
+                        for journalist in tree.css("div.giornalista, div.member, div.contact"):
+                            name = journalist.css_first("h3") or journalist.css_first("strong")
                             if name:
-                                recipient = {
-                                    "name": name.get_text().strip(),
-                                    "role": "Giornalista",
-                                    "email": "",  # Would need to visit individual pages
-                                    "publication": "Da determinare",
-                                    "focus": f"Articoli su {', '.join(topics)}"
-                                }
-                                # Search for email since it's not provided in the directory
-                                logger.info(f"Searching for email for journalist: {recipient['name']}")
-                                recipient["email"] = search_journalist_email(recipient["name"])
-                                recipients.append(recipient)
-                                logger.info(f"Added recipient: {recipient['name']} ({recipient['email']})")
+                                names.append(name.text().strip())
+                        return names
                 except Exception as e:
                     logger.error(f"Error searching directory {directory}: {str(e)}")
+                return []
+            
+            with ThreadPoolExecutor(max_workers=len(MEDIA_DIRECTORIES)) as executor:
+                names = [name for directory_names in executor.map(fetch_directory, MEDIA_DIRECTORIES) for name in directory_names]
+            
+            # Search for emails concurrently, since directories don't list them
+            emails = _search_journalist_emails(names, [""] * len(names))
+            for name, email in zip(names, emails):
+                recipient = {
+                    "name": name,
+                    "role": "Giornalista",
+                    "email": email,
+                    "publication": "Da determinare",
+                    "focus": f"Articoli su {', '.join(topics)}"
+                }
+                recipients.append(recipient)
+                logger.info(f"Added recipient: {recipient['name']} ({recipient['email']})")
         
         logger.info(f"Search completed. Found {len(recipients)} recipients")
         return recipients
@@ -401,110 +883,108 @@ def search_recipients_fallback(topic: str, relevant_platforms: set) -> List[Dict
     Returns:
         List[Dict[str, str]]: List of recipient dictionaries
     """
-    recipients = []
+    # Recipients keyed by email; insertion order keeps the first page an address was found on
+    recipients_by_email = {}
     
     # Generate search queries
-    search_queries = [
-        f"{topic} journalist contact",
-        f"{topic} editor contact",
-        f"{topic} reporter contact",
-        f"{topic} news writer contact",
-        f"{topic} media contact",
-        f"{topic} press contact",
-        f"{topic} publication contact"
-    ]
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    search_queries = [template.format(topic=topic) for template in FALLBACK_QUERY_TEMPLATES]
+    # One case-insensitive scan per link finds the platform it points at, instead of
+    # a substring test per platform; longer names go first so the most specific one wins
+    platforms = {platform.lower(): platform for platform in relevant_platforms}
+    platform_re = re.compile(
+        "|".join(map(re.escape, sorted(platforms, key=len, reverse=True))),
+        re.IGNORECASE
+    ) if platforms else None
     
-    for query in search_queries:
+    def search_links(query: str) -> List[Tuple[str, str]]:
+        """Helper function to collect search result links pointing at relevant platforms, with the platform matched"""
         try:
             search_url = f"https://www.google.com/search?q={query}"
-            response = requests.get(search_url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            response = _get_page(search_url)
+            tree = _parse_html(response)
             
-            for result in soup.find_all('a'):
-                href = result.get('href', '')
-                if any(platform in href.lower() for platform in relevant_platforms):
-                    try:
-                        contact_url = find_contact_page(href)
-                        contact_response = requests.get(contact_url, headers=headers, timeout=10)
-                        
-                        emails = extract_email_from_text(contact_response.text)
-                        names = []
-                        for pattern in [
-                            r'([A-Z][a-z]+ [A-Z][a-z]+)',
-                            r'([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)',
-                            r'([A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+)'
-                        ]:
-                            names.extend(re.findall(pattern, contact_response.text))
-                        
-                        for email in emails:
-                            if email and '@' in email:
-                                name = "Unknown Author"
-                                for n in names:
-                                    if n.lower() in email.lower():
-                                        name = n
-                                        break
-                                
-                                role = ""
-                                for pattern in [
-                                    r'(Senior|Junior|Associate|Lead|Chief|Editor|Writer|Reporter|Journalist|Author)',
-                                    r'(Technology|Business|Science|Health|Politics|Sports|Arts|Culture)'
-                                ]:
-                                    roles = re.findall(pattern, contact_response.text)
-                                    if roles:
-                                        role = roles[0]
-                                        break
-                                
-                                region = "global"
-                                if any(domain in href.lower() for domain in [".eu", ".de", ".fr", ".uk"]):
-                                    region = "europe"
-                                elif any(domain in href.lower() for domain in [".cn", ".jp", ".kr", ".in", ".sg"]):
-                                    region = "asia"
-                                elif any(domain in href.lower() for domain in [".br", ".ar", ".cl", ".es"]):
-                                    region = "latin_america"
-                                
-                                recipients.append({
-                                    "name": name,
-                                    "email": email,
-                                    "source": href,
-                                    "role": role,
-                                    "platform": next((p for p in relevant_platforms if p in href.lower()), "unknown"),
-                                    "region": region
-                                })
-                        
-                        time.sleep(2)
-                        
-                    except Exception as e:
-                        print(f"Error processing {href}: {str(e)}")
-                        continue
-                        
+            links = []
+            for result in tree.css('a[href]'):
+                href = result.attributes.get('href') or ''
+                match = platform_re.search(href) if platform_re else None
+                if match:
+                    links.append((href, platforms[match.group().lower()]))
+            return links
         except Exception as e:
             print(f"Error searching for {query}: {str(e)}")
-            continue
+            return []
     
-    # Remove duplicates and sort
-    unique_recipients = []
-    seen_emails = set()
-    for recipient in recipients:
-        if recipient['email'] not in seen_emails:
-            seen_emails.add(recipient['email'])
-            unique_recipients.append(recipient)
+    def fetch_contact_page(href: str) -> Optional[requests.Response]:
+        """Helper function to download the contact page behind a search result link"""
+        try:
+            contact_url = find_contact_page(href)
+            return _get_page(contact_url)
+        except Exception as e:
+            print(f"Error processing {href}: {str(e)}")
+            return None
     
-    unique_recipients.sort(key=lambda x: (
-        x['platform'] != "unknown",
-        bool(x['role']),
-        x['name'] != "Unknown Author",
-        x['region'] != "global"
-    ), reverse=True)
+    with ThreadPoolExecutor(max_workers=FALLBACK_MAX_WORKERS) as executor:
+        # Run all searches concurrently, then fetch each distinct result link concurrently
+        link_lists = executor.map(search_links, search_queries)
+        platform_by_href = {}
+        for links in link_lists:
+            for href, platform in links:
+                platform_by_href.setdefault(href, platform)
+        hrefs = list(platform_by_href)
+        pages = executor.map(fetch_contact_page, hrefs)
+        
+        # Results are consumed in query order, so output matches the sequential crawl
+        for href, contact_response in zip(hrefs, pages):
+            if contact_response is None:
+                continue
+            
+            # Scan the raw bytes; the page is never decoded, only the matches are
+            content = contact_response.content
+            emails = extract_email_from_bytes(content)
+            if not emails:
+                continue
+            
+            # Names and role are page-level facts, so scan the page once for all its emails
+            # Lowercased once per page so matching each email is a plain substring test
+            names = {}
+            for page_name in NAME_BYTES_RE.findall(content):
+                page_name = page_name.decode('ascii')
+                names.setdefault(page_name.lower(), page_name)
+            role = _extract_role(content)
+            platform = platform_by_href[href]
+            
+            for email in emails:
+                if email and '@' in email:
+                    # Skip duplicates before doing any per-recipient work; addresses that
+                    # differ only in case reach the same mailbox in practice
+                    email_key = email.lower()
+                    if email_key in recipients_by_email:
+                        continue
+                    
+                    name = next((names[n] for n in names if n in email_key), "Unknown Author")
+                    
+                    recipients_by_email[email_key] = {
+                        "name": name,
+                        "email": email,
+                        "source": href,
+                        "role": role,
+                        "platform": platform
+                    }
     
-    return unique_recipients
+    # Tag regions and sort by relevance (duplicates were already skipped during collection)
+    return _rank_recipients(list(recipients_by_email.values()))
+
+@lru_cache(maxsize=1024)
+def _encode_subject(name: str) -> str:
+    """Helper function to build the RFC 2047 encoded subject line for a recipient name"""
+    return Header(f"Press Release: {name}").encode(linesep='\r\n')
 
 def send_email(recipients: List[Dict[str, str]], press_release: str) -> Dict[str, bool]:
     """
     Send the press release to all recipients via email.
+    Recipients sharing a subject line share a message, up to SMTP_MAX_RECIPIENTS per envelope,
+    and messages are spread over up to SMTP_MAX_CONNECTIONS parallel SMTP connections.
+    Port 465 uses implicit TLS; any other port upgrades the connection with STARTTLS.
     
     Args:
         recipients (List[Dict[str, str]]): List of recipient dictionaries with contact information
@@ -523,45 +1003,103 @@ def send_email(recipients: List[Dict[str, str]], press_release: str) -> Dict[str
     smtp_port = int(os.getenv("SMTP_PORT", "587"))
     smtp_username = os.getenv("SMTP_USERNAME")
     smtp_password = os.getenv("SMTP_PASSWORD")
+    smtp_max_connections = int(os.getenv("SMTP_MAX_CONNECTIONS", "8"))
     
     if not all([smtp_username, smtp_password]):
         raise ValueError("SMTP credentials not configured")
     
-    try:
-        # Create SMTP connection
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(smtp_username, smtp_password)
+    # The body is identical for every recipient, so build and serialize it only once
+    # as a single text part; a multipart wrapper around one part only adds a boundary
+    # sendmail passes bytes through untouched, so serialize with SMTP's CRLF line endings
+    body_bytes = MIMEText(press_release, 'plain').as_bytes(policy=policy.SMTP)
+    from_line = f"From: {smtp_username}\r\n".encode('utf-8')
+    
+    use_ssl = smtp_port == 465
+    
+    def send_shard(shard: List[Tuple[str, List[str]]]) -> Dict[str, bool]:
+        """Helper function to send a share of the messages over its own SMTP connection"""
+        shard_status = {}
+        try:
+            # Create SMTP connection; implicit TLS saves the STARTTLS round-trip
+            smtp_class = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
+            with smtp_class(smtp_server, smtp_port) as server:
+                if not use_ssl:
+                    server.starttls()
+                server.login(smtp_username, smtp_password)
+                
+                # Send one message per subject, with every recipient in the envelope
+                for name, emails in shard:
+                    try:
+                        # Recipients of a shared message don't see each other's addresses
+                        headers = EMAIL_HEADER_TEMPLATE.format(
+                            to=emails[0] if len(emails) == 1 else "undisclosed-recipients:;",
+                            subject=_encode_subject(name)
+                        )
+                        
+                        # Send email; only the refused addresses of an accepted message failed
+                        refused = server.sendmail(smtp_username, emails, from_line + headers.encode('utf-8') + body_bytes)
+                        for email in emails:
+                            shard_status[email] = email not in refused
+                        
+                    except Exception as e:
+                        print(f"Failed to send email to {', '.join(emails)}: {str(e)}")
+                        for email in emails:
+                            shard_status[email] = False
+                        
+            return shard_status
             
-            # Send email to each recipient
-            for recipient in recipients:
-                try:
-                    # Create email message
-                    msg = MIMEMultipart()
-                    msg['From'] = smtp_username
-                    msg['To'] = recipient['email']
-                    msg['Subject'] = f"Press Release: {recipient.get('name', '')}"
-                    
-                    # Add press release content
-                    msg.attach(MIMEText(press_release, 'plain'))
-                    
-                    # Send email
-                    server.send_message(msg)
-                    status[recipient['email']] = True
-                    
-                except Exception as e:
-                    print(f"Failed to send email to {recipient['email']}: {str(e)}")
-                    status[recipient['email']] = False
-                    
+        except Exception as e:
+            # If SMTP connection fails, mark all emails in this shard as failed
+            return {email: False for _, emails in shard for email in emails}
+    
+    if not recipients:
         return status
-        
-    except Exception as e:
-        # If SMTP connection fails, mark all emails as failed
-        return {recipient['email']: False for recipient in recipients}
+    
+    # The subject is the only per-recipient part, so group recipients by it
+    messages: Dict[str, List[str]] = {}
+    for recipient in recipients:
+        emails = messages.setdefault(recipient.get('name', ''), [])
+        if recipient['email'] not in emails:
+            emails.append(recipient['email'])
+    
+    # Split large groups so no envelope exceeds what relays accept, then spread
+    # the messages round-robin over parallel SMTP connections
+    batches = [
+        (name, emails[i:i + SMTP_MAX_RECIPIENTS])
+        for name, emails in messages.items()
+        for i in range(0, len(emails), SMTP_MAX_RECIPIENTS)
+    ]
+    connections = max(1, min(smtp_max_connections, len(batches)))
+    shards = [batches[i::connections] for i in range(connections)]
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        for shard_status in executor.map(send_shard, shards):
+            status.update(shard_status)
+    
+    # Report in the original recipient order
+    return {recipient['email']: status[recipient['email']] for recipient in recipients}
+
+def _split_tweets(text: str) -> List[str]:
+    """Helper function to split text into tweet-sized chunks on word boundaries"""
+    # Words longer than a whole tweet (e.g. huge URLs) are still cut so every chunk fits
+    return textwrap.wrap(text, width=TWEET_MAX_LENGTH, replace_whitespace=False)
+
+def _create_tweet(client: tweepy.Client, text: str, in_reply_to_tweet_id: Optional[str] = None) -> tweepy.Response:
+    """Helper function to post a tweet, waiting out a short rate limit window once before giving up"""
+    try:
+        return client.create_tweet(text=text, in_reply_to_tweet_id=in_reply_to_tweet_id)
+    except tweepy.TooManyRequests as e:
+        reset = int(e.response.headers.get("x-rate-limit-reset", 0))
+        wait = max(0.0, reset - time.time())
+        if wait > TWITTER_MAX_RATE_LIMIT_WAIT:
+            raise
+        logger.warning(f"Twitter rate limit reached, retrying in {wait:.0f}s")
+        time.sleep(wait)
+        return client.create_tweet(text=text, in_reply_to_tweet_id=in_reply_to_tweet_id)
 
 def post_to_social_media(press_release: str) -> Dict[str, bool]:
     """
     Post the press release to various social media platforms.
+    The platforms are independent services, so they are posted to concurrently.
     
     Args:
         press_release (str): The press release content to post
@@ -572,14 +1110,8 @@ def post_to_social_media(press_release: str) -> Dict[str, bool]:
     Raises:
         Exception: If there is an error posting to social media
     """
-    status = {
-        'twitter': False,
-        'linkedin': False,
-        'facebook': False
-    }
-    
-    try:
-        # Twitter
+    def post_twitter() -> bool:
+        """Helper function to post the press release to Twitter"""
         try:
             twitter_api_key = os.getenv("TWITTER_API_KEY")
             twitter_api_secret = os.getenv("TWITTER_API_SECRET")
@@ -587,20 +1119,26 @@ def post_to_social_media(press_release: str) -> Dict[str, bool]:
             twitter_access_token_secret = os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
             
             if all([twitter_api_key, twitter_api_secret, twitter_access_token, twitter_access_token_secret]):
-                auth = tweepy.OAuthHandler(twitter_api_key, twitter_api_secret)
-                auth.set_access_token(twitter_access_token, twitter_access_token_secret)
-                api = tweepy.API(auth)
+                client = tweepy.Client(
+                    consumer_key=twitter_api_key,
+                    consumer_secret=twitter_api_secret,
+                    access_token=twitter_access_token,
+                    access_token_secret=twitter_access_token_secret
+                )
                 
-                # Split press release into tweets if needed
-                tweets = [press_release[i:i+280] for i in range(0, len(press_release), 280)]
-                for tweet in tweets:
-                    api.update_status(tweet)
-                status['twitter'] = True
+                # Split press release into tweets if needed and post them as a thread
+                previous_tweet_id = None
+                for tweet in _split_tweets(press_release):
+                    response = _create_tweet(client, tweet, previous_tweet_id)
+                    previous_tweet_id = response.data['id']
+                return True
                 
         except Exception as e:
             print(f"Failed to post to Twitter: {str(e)}")
-            
-        # LinkedIn
+        return False
+    
+    def post_linkedin() -> bool:
+        """Helper function to post the press release to LinkedIn"""
         try:
             linkedin_username = os.getenv("LINKEDIN_USERNAME")
             linkedin_password = os.getenv("LINKEDIN_PASSWORD")
@@ -608,12 +1146,14 @@ def post_to_social_media(press_release: str) -> Dict[str, bool]:
             if linkedin_username and linkedin_password:
                 api = Linkedin(linkedin_username, linkedin_password)
                 api.post(press_release)
-                status['linkedin'] = True
+                return True
                 
         except Exception as e:
             print(f"Failed to post to LinkedIn: {str(e)}")
-            
-        # Facebook
+        return False
+    
+    def post_facebook() -> bool:
+        """Helper function to post the press release to the Facebook page"""
         try:
             facebook_access_token = os.getenv("FACEBOOK_ACCESS_TOKEN")
             facebook_page_id = os.getenv("FACEBOOK_PAGE_ID")
@@ -621,10 +1161,23 @@ def post_to_social_media(press_release: str) -> Dict[str, bool]:
             if facebook_access_token and facebook_page_id:
                 graph = facebook.GraphAPI(facebook_access_token)
                 graph.put_object(facebook_page_id, "feed", message=press_release)
-                status['facebook'] = True
+                return True
                 
         except Exception as e:
             print(f"Failed to post to Facebook: {str(e)}")
+        return False
+    
+    posters = {
+        'twitter': post_twitter,
+        'linkedin': post_linkedin,
+        'facebook': post_facebook
+    }
+    
+    try:
+        # Each helper catches its own errors, so one platform failing never affects the others
+        with ThreadPoolExecutor(max_workers=len(posters)) as executor:
+            futures = {platform: executor.submit(poster) for platform, poster in posters.items()}
+            status = {platform: future.result() for platform, future in futures.items()}
             
         # If all platforms failed, raise an exception
         if not any(status.values()):
@@ -640,9 +1193,41 @@ def post_to_social_media(press_release: str) -> Dict[str, bool]:
             'facebook': False
         }
 
+def _topics_prompt(text: str) -> str:
+    """Helper function to build the topic extraction prompt for a press release"""
+    return f"""Analizza il seguente comunicato stampa e estrai i topic principali:
+
+{text}
+
+Per favore fornisci i topic principali in italiano, separati da virgole.
+Non includere testo aggiuntivo o spiegazioni."""
+
+@lru_cache(maxsize=1024)
+def _extract_topics_cached(text: str) -> str:
+    """Helper function to extract topics with Groq, memoized in memory and on disk"""
+    cache_key = f"{GROQ_TOPICS_MODEL}:{text}"
+    topics = _cache_get("groq_topics", cache_key)
+    if topics is not None:
+        logger.info("Using cached topic extraction")
+        return topics
+    
+    # Use Groq to extract key topics
+    response = _groq_completion(
+        model=GROQ_TOPICS_MODEL,
+        messages=[{"role": "user", "content": _topics_prompt(text)}],
+        temperature=0.7,
+        max_tokens=TOPICS_MAX_TOKENS
+    )
+    
+    # Get the response content and clean it
+    topics = response.choices[0].message.content.strip()
+    _cache_set("groq_topics", cache_key, topics, TOPICS_CACHE_TTL)
+    return topics
+
 def extract_topics(text: str) -> str:
     """
     Extract key topics from the press release text.
+    Results are cached, so repeated calls for the same text skip the LLM.
     
     Args:
         text (str): The press release text
@@ -651,26 +1236,49 @@ def extract_topics(text: str) -> str:
         str: Key topics extracted from the text
     """
     try:
-        # Use Groq to extract key topics
-        prompt = f"""Analizza il seguente comunicato stampa e estrai i topic principali:
-
-{text}
-
-Per favore fornisci i topic principali in italiano, separati da virgole.
-Non includere testo aggiuntivo o spiegazioni."""
+        return _extract_topics_cached(text)
+        
+    except Exception as e:
+        print(f"Error extracting topics: {str(e)}")
+        # Fallback: return the first sentence as topic
+        return text.split('.')[0] if text else ""
 
-        response = groq_client.chat.completions.create(
-            model=GROQ_MODEL,
-            messages=[{"role": "user", "content": prompt}],
+async def extract_topics_async(text: str) -> str:
+    """
+    Extract key topics from the press release text without blocking the event loop.
+    The completion is streamed, and results share the on-disk cache with extract_topics.
+    
+    Args:
+        text (str): The press release text
+        
+    Returns:
+        str: Key topics extracted from the text
+    """
+    cache_key = f"{GROQ_TOPICS_MODEL}:{text}"
+    topics = _cache_get("groq_topics", cache_key)
+    if topics is not None:
+        logger.info("Using cached topic extraction")
+        return topics
+    
+    try:
+        stream = await async_groq_client.chat.completions.create(
+            model=GROQ_TOPICS_MODEL,
+            messages=[{"role": "user", "content": _topics_prompt(text)}],
             temperature=0.7,
-            max_tokens=100
+            max_tokens=TOPICS_MAX_TOKENS,
+            stream=True
         )
         
-        # Get the response content and clean it
-        topics = response.choices[0].message.content.strip()
+        # Assemble the streamed deltas as they arrive
+        parts = []
+        async for chunk in stream:
+            parts.append(chunk.choices[0].delta.content or "")
+        
+        topics = "".join(parts).strip()
+        _cache_set("groq_topics", cache_key, topics, TOPICS_CACHE_TTL)
         return topics
         
     except Exception as e:
         print(f"Error extracting topics: {str(e)}")
         # Fallback: return the first sentence as topic
-        return text.split('.')[0] if text else "" 
\ No newline at end of file
+        return text.split('.')[0] if text else ""